@@ -16,9 +16,21 @@ CATEGORY_URLS = [
 ]
 
 # Scraping settings
-REQUEST_DELAY = 2  # Seconds between requests (be respectful)
 REQUEST_TIMEOUT = 10  # Seconds
 MAX_RETRIES = 3
+RETRY_BACKOFF_BASE = 1.0  # Seconds; retry n waits up to base * 2**n (full jitter)
+RETRY_BACKOFF_CAP = 30.0  # Seconds; upper bound for a single retry wait
+MAX_CONCURRENT_REQUESTS = 8  # Parallel requests to welt.de (be respectful, even over HTTP/2)
+RATE_LIMIT = 4.0  # Requests per second per host until the server advertises a limit
+RATE_LIMIT_BURST = 8  # Requests that may be sent back-to-back before the rate applies
+RATE_LIMIT_MIN = 0.5  # Bounds for the rate adapted from X-RateLimit-* headers
+RATE_LIMIT_MAX = 20.0
+RATE_LIMIT_MAX_PAUSE = 300  # Seconds; a host asking to pause longer is skipped for the run
+NUM_WORKERS = 64  # Coroutines consuming the shared URL queue
+PARSE_WORKERS = None  # Processes parsing article HTML; None uses one per CPU core
+CONNECTION_POOL_SIZE = 32  # Max pooled connections across all hosts
+KEEPALIVE_TIMEOUT = 30  # Seconds an idle pooled connection is kept open
+MAX_PAGE_SIZE = 2 * 1024 * 1024  # Bytes; larger pages are skipped
 MAX_ARTICLES_PER_CATEGORY = 50  # Limit for one-time bulk scraping
 
 # Headers
@@ -28,14 +40,19 @@ HEADERS = {
     "User-Agent": USER_AGENT,
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
     "Accept-Language": "de-DE,de;q=0.9,en;q=0.8",
-    "Accept-Encoding": "gzip, deflate",
-    "Connection": "keep-alive",
+    "Accept-Encoding": "gzip, deflate, br, zstd",  # br/zstd are decoded via httpx extras
+    # No "Connection" header: it is forbidden in HTTP/2 and httpx keeps connections alive anyway
 }
 
 # Storage settings
 DATA_DIR = "data"
 ARTICLE_FILENAME_FORMAT = "{date}_{id}.json"  # Format: 2024-01-15_abc123.json
-COMBINED_OUTPUT = "data/all_articles.json"  # Optional: all articles in one file
+COMBINED_OUTPUT = "data/articles.jsonl"  # All articles, one JSON object per line (appended across runs)
+CACHE_FILE = "cache.json"  # ETag/Last-Modified per category URL for conditional requests
+SEEN_FILE = "seen.bloom"  # Bloom filter of article URLs saved by previous runs (dedups COMBINED_OUTPUT)
+SEEN_CAPACITY = 100_000  # Initial Bloom filter capacity (grows automatically)
+SEEN_ERROR_RATE = 1e-4  # False-positive rate; a false positive skips an unseen article
+SEEN_SAVE_INTERVAL = 100  # Re-save the filter every N saved articles during a run
 
 # Logging
 LOG_LEVEL = "INFO"
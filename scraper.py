@@ -4,18 +4,38 @@ Welt.de News Scraper
 Scrapes German news articles from welt.de and stores them in JSON format
 """
 
-import requests
-from bs4 import BeautifulSoup
+import asyncio
+import httpx
+from concurrent.futures import ProcessPoolExecutor
+import lxml.html
+from lxml import etree
+from pybloom_live import ScalableBloomFilter
 import json
-import time
 import logging
 import hashlib
+import math
+import multiprocessing
 import os
-from datetime import datetime
-from urllib.parse import urljoin, urlparse
+import random
+import re
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urldefrag, urljoin, urlparse
 from dateutil import parser as date_parser
 import config
 
+try:
+    import orjson  # Optional: faster serialization with native UTF-8 output
+except ImportError:
+    orjson = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser  # Optional: faster, lighter article parsing
+except ImportError:
+    LexborHTMLParser = None
+
 
 # Setup logging
 logging.basicConfig(
@@ -27,144 +47,655 @@ logging.basicConfig(
     ]
 )
 logger = logging.getLogger(__name__)
+# httpx logs every request at INFO; get_page already logs each fetch
+logging.getLogger('httpx').setLevel(logging.WARNING)
+
+# Article URLs (fragment already removed): a section (or /article/) followed by at least
+# two more path segments, which rules out category pages like /politik/ or /politik/ausland
+ARTICLE_URL_RE = re.compile(
+    re.escape(config.BASE_URL)
+    + r'/(?:article|politik|wirtschaft|sport|kultur|wissenschaft)/[^?#]+/[^/?#]+(?:\?[^#]*)?$'
+)
+
+# One HTML parser for every page: no network access, blank text nodes dropped
+_PARSER = lxml.html.HTMLParser(encoding='utf-8', remove_blank_text=True, no_network=True, huge_tree=False)
+
+
+def _xpath(path):
+    """Compile an XPath expression that returns plain strings"""
+    return etree.XPath(path, smart_strings=False)
+
+
+# XPath queries for article fields, compiled once; each field tries its queries in order
+_LOWER_CLASS = "translate(@class, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+_XP_LINKS = _xpath('//a/@href')
+_XP_TEXT = _xpath('.//text()')
+_XP_PARAGRAPHS = _xpath('.//p')
+_XP_TITLE = [_xpath('(//h1)[1]'), _xpath('(//title)[1]')]
+_XP_AUTHOR_META = _xpath('(//meta[@name="author"])[1]/@content')
+_XP_AUTHOR = [
+    _xpath(f'(//span[contains({_LOWER_CLASS}, "author")])[1]'),
+    _xpath('(//a[contains(concat(" ", normalize-space(@rel), " "), " author ")])[1]'),
+]
+_XP_DATE_META = [
+    _xpath('(//meta[@property="article:published_time"])[1]/@content'),
+    _xpath('(//meta[@name="date"])[1]/@content'),
+]
+_XP_TIME = _xpath('(//time)[1]')
+_XP_CATEGORY = [
+    _xpath('(//meta[@property="article:section"])[1]/@content'),
+    _xpath('(//meta[@name="category"])[1]/@content'),
+]
+_XP_JSON_LD = _xpath('//script[@type="application/ld+json"]/text()')
+_XP_ARTICLE = _xpath('(//article)[1]')
+_XP_CLASSED_DIVS = _xpath('//div[@class]')
+BODY_CLASS_RE = re.compile('article|content|body|text', re.IGNORECASE)
+
+# schema.org types whose JSON-LD carries the article metadata
+NEWS_ARTICLE_TYPES = {
+    'Article', 'NewsArticle', 'ReportageNewsArticle', 'AnalysisNewsArticle',
+    'OpinionNewsArticle', 'BackgroundNewsArticle', 'ReviewNewsArticle', 'LiveBlogPosting',
+}
+
+
+def parse_html(content):
+    """Parse raw page bytes into an lxml document tree"""
+    return lxml.html.document_fromstring(content, parser=_PARSER)
+
+
+def find_article_body(tree):
+    """Return the first <article>, else the first div whose class names a body container"""
+    article = _XP_ARTICLE(tree)
+    if article:
+        return article[0]
+    # One C-level regex search per class attribute, stopping at the first hit; a
+    # case-insensitive XPath/CSS predicate would translate() every class four times
+    for div in _XP_CLASSED_DIVS(tree):
+        if BODY_CLASS_RE.search(div.get('class')):
+            return div
+    return None
+
+
+def load_json(text):
+    """Parse JSON text, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _json_ld_items(data):
+    """Yield every object in a JSON-LD document, including lists and @graph entries"""
+    if isinstance(data, list):
+        for item in data:
+            yield from _json_ld_items(item)
+    elif isinstance(data, dict):
+        yield data
+        yield from _json_ld_items(data.get('@graph'))
+
+
+def _json_ld_text(value):
+    """Flatten a JSON-LD value (string, {"name": ...} object or list of them) to a string"""
+    if isinstance(value, str):
+        return value.strip() or None
+    if isinstance(value, dict):
+        return _json_ld_text(value.get('name'))
+    if isinstance(value, list):
+        parts = [_json_ld_text(item) for item in value]
+        return ', '.join(part for part in parts if part) or None
+    return None
+
+
+def json_ld_metadata(scripts):
+    """Return title/author/date/category/text from the page's NewsArticle JSON-LD scripts"""
+    for script in scripts:
+        try:
+            data = load_json(script)
+        except ValueError:
+            continue
+        for item in _json_ld_items(data):
+            types = item.get('@type')
+            types = types if isinstance(types, list) else [types]
+            if not any(t in NEWS_ARTICLE_TYPES for t in types if isinstance(t, str)):
+                continue
+            section = item.get('articleSection')
+            if isinstance(section, list):
+                section = section[0] if section else None
+            return {
+                'title': _json_ld_text(item.get('headline')),
+                'author': _json_ld_text(item.get('author')),
+                'date': _json_ld_text(item.get('datePublished')),
+                'category': _json_ld_text(section),
+                'text': _json_ld_text(item.get('articleBody')),
+            }
+    return {}
+
+
+def dump_json(data):
+    """Serialize data to compact UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+@contextmanager
+def open_atomic(path):
+    """Open path for binary writing; readers only ever see the old or the complete new file"""
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, 'wb', buffering=1 << 20) as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def first_match(tree, queries):
+    """Return the result of the first compiled XPath query that matches anything"""
+    for query in queries:
+        result = query(tree)
+        if result:
+            return result
+    return None
+
+
+def node_text(node):
+    """Concatenate the stripped text of a node (like BeautifulSoup's get_text(strip=True))"""
+    return ''.join(part.strip() for part in _XP_TEXT(node))
+
+
+def extract_fields_lxml(content):
+    """Pull the raw article fields out of a page with lxml"""
+    tree = parse_html(content)
+
+    # Structured NewsArticle metadata comes first; HTML heuristics only fill the gaps
+    fields = json_ld_metadata(_XP_JSON_LD(tree))
+
+    # Extract title
+    if not fields.get('title'):
+        title_node = first_match(tree, _XP_TITLE)
+        if title_node:
+            fields['title'] = node_text(title_node[0])
+
+    # Extract author
+    if not fields.get('author'):
+        fields['author'] = (_XP_AUTHOR_META(tree) or [None])[0]
+    if not fields.get('author'):
+        author_node = first_match(tree, _XP_AUTHOR)
+        if author_node:
+            fields['author'] = node_text(author_node[0])
+
+    # Extract publication date
+    if not fields.get('date'):
+        fields['date'] = (first_match(tree, _XP_DATE_META) or [None])[0]
+    if not fields.get('date'):
+        time_node = _XP_TIME(tree)
+        if time_node:
+            time_node = time_node[0]
+            fields['date'] = time_node.get('content') or time_node.get('datetime') or node_text(time_node)
+
+    # Extract category
+    if not fields.get('category'):
+        fields['category'] = (first_match(tree, _XP_CATEGORY) or [None])[0]
+
+    # Extract article text
+    if not fields.get('text'):
+        # Look for article body (common patterns on news sites)
+        article_body = find_article_body(tree)
+        if article_body is not None:
+            # Extract all paragraphs
+            text_parts = [node_text(p) for p in _XP_PARAGRAPHS(article_body)]
+            fields['text'] = '\n\n'.join(part for part in text_parts if part)
+
+    return fields
+
+
+# CSS selectors for the selectolax path, mirroring the XPath queries above
+_CSS_AUTHOR = ['span[class*="author" i]', 'a[rel~="author"]']
+_CSS_DATE_META = ['meta[property="article:published_time"]', 'meta[name="date"]']
+_CSS_CATEGORY = ['meta[property="article:section"]', 'meta[name="category"]']
+_CSS_BODY_DIV = ', '.join(f'div[class*="{term}" i]' for term in ['article', 'content', 'body', 'text'])
+
+
+def _css_first(tree, selectors):
+    """Return the first node matched by the first selector that matches anything"""
+    for selector in selectors:
+        node = tree.css_first(selector)
+        if node is not None:
+            return node
+    return None
+
+
+def _sx_text(node):
+    """Concatenate the stripped text of a selectolax node, like node_text()"""
+    return node.text(deep=True, separator='', strip=True)
+
+
+def extract_fields_selectolax(content):
+    """Pull the raw article fields out of a page with selectolax (lexbor)"""
+    tree = LexborHTMLParser(content)
+
+    fields = json_ld_metadata(
+        node.text() for node in tree.css('script[type="application/ld+json"]')
+    )
+
+    if not fields.get('title'):
+        title_node = tree.css_first('h1') or tree.css_first('title')
+        if title_node is not None:
+            fields['title'] = _sx_text(title_node)
+
+    if not fields.get('author'):
+        author_meta = tree.css_first('meta[name="author"]')
+        if author_meta is not None:
+            fields['author'] = author_meta.attributes.get('content')
+    if not fields.get('author'):
+        author_node = _css_first(tree, _CSS_AUTHOR)
+        if author_node is not None:
+            fields['author'] = _sx_text(author_node)
+
+    if not fields.get('date'):
+        date_meta = _css_first(tree, _CSS_DATE_META)
+        date_str = date_meta.attributes.get('content') if date_meta is not None else None
+        if not date_str:
+            time_node = tree.css_first('time')
+            if time_node is not None:
+                date_str = time_node.attributes.get('content') or time_node.attributes.get('datetime') or \
+                           _sx_text(time_node)
+        fields['date'] = date_str
+
+    if not fields.get('category'):
+        category_meta = _css_first(tree, _CSS_CATEGORY)
+        if category_meta is not None:
+            fields['category'] = category_meta.attributes.get('content')
+
+    if not fields.get('text'):
+        article_body = tree.css_first('article') or tree.css_first(_CSS_BODY_DIV)
+        if article_body is not None:
+            text_parts = [_sx_text(p) for p in article_body.css('p')]
+            fields['text'] = '\n\n'.join(part for part in text_parts if part)
+
+    return fields
+
+
+# Prefer the selectolax fast path when it is installed
+extract_fields = extract_fields_selectolax if LexborHTMLParser is not None else extract_fields_lxml
+
+
+def normalize_date(date_str):
+    """Return a publication date as ISO 8601, trying fromisoformat before dateutil"""
+    # article:published_time and JSON-LD dates are ISO 8601 already; dateutil is
+    # much slower and only needed for anything else
+    try:
+        return datetime.fromisoformat(date_str.replace('Z', '+00:00')).isoformat()
+    except ValueError:
+        pass
+    try:
+        return date_parser.parse(date_str).isoformat()
+    except (ValueError, OverflowError):
+        return date_str
+
+
+def parse_article(url, content, scraped_at):
+    """Extract article fields from raw page bytes (runs in a parser process)"""
+    article_data = {
+        'url': url,
+        'scraped_at': scraped_at,
+        'title': None,
+        'text': None,
+        'date': None,
+        'author': None,
+        'category': None,
+    }
+
+    try:
+        fields = extract_fields(content)
+        article_data['title'] = fields.get('title')
+        article_data['author'] = fields.get('author')
+        article_data['text'] = fields.get('text')
+
+        if fields.get('date'):
+            article_data['date'] = normalize_date(fields['date'])
+
+        if fields.get('category'):
+            article_data['category'] = fields['category']
+        else:
+            # Try to extract from URL
+            path_parts = urlparse(url).path.split('/')
+            if len(path_parts) > 1:
+                article_data['category'] = path_parts[1]
+
+        # Validate we got essential data
+        if not article_data['title'] or not article_data['text']:
+            logger.warning(f"Missing essential data for {url}")
+            return None
+
+        logger.info(f"Successfully extracted: {article_data['title'][:50]}...")
+        return article_data
+
+    except Exception as e:
+        logger.error(f"Error extracting content from {url}: {e}")
+        return None
+
+
+# Returned by get_page when the server answers 304 to a conditional request
+NOT_MODIFIED = object()
+
+# Content types worth downloading and parsing
+HTML_CONTENT_TYPES = ('text/html', 'application/xhtml+xml')
+
+# Statuses worth retrying; any other 4xx means the request itself is bad
+RETRYABLE_STATUSES = {408, 429}
+
+
+def is_retryable_status(status):
+    """Return True for HTTP statuses that may succeed on a later attempt"""
+    return status in RETRYABLE_STATUSES or status >= 500
+
+
+def parse_retry_after(value):
+    """Parse a Retry-After header (seconds or HTTP date) into seconds"""
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        pass
+    else:
+        # float() also accepts 'inf' and 'nan', which no server means
+        return max(0.0, seconds) if math.isfinite(seconds) else None
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def backoff_delay(retries, retry_after=None):
+    """Capped exponential backoff with full jitter, honoring Retry-After"""
+    delay = random.uniform(0, min(config.RETRY_BACKOFF_CAP, config.RETRY_BACKOFF_BASE * (2 ** retries)))
+    if retry_after is not None:
+        delay = max(delay, min(retry_after, config.RETRY_BACKOFF_CAP))
+    return delay
+
+
+def parse_rate_limit(headers):
+    """Read X-RateLimit-Remaining/Reset into (remaining, seconds until reset)"""
+    remaining = headers.get('X-RateLimit-Remaining', '')
+    reset = headers.get('X-RateLimit-Reset', '')
+    try:
+        remaining, reset = int(remaining), float(reset)
+    except ValueError:
+        return None
+    if not math.isfinite(reset):
+        return None
+    # Some servers send an epoch timestamp instead of a delta
+    if reset > 1e9:
+        reset -= time.time()
+    return max(0, remaining), max(0.0, reset)
+
+
+class TokenBucket:
+    """Async token bucket limiting requests to one host, adapted from response headers"""
+
+    def __init__(self, host, rate, capacity):
+        self.host = host
+        self.rate = rate  # Tokens per second
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        # Set when the server asks for a longer pause than RATE_LIMIT_MAX_PAUSE
+        self.blocked = False
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a request may be sent, then take a token"""
+        # Waiters queue on the lock, so tokens are handed out in arrival order
+        async with self.lock:
+            while not self.blocked:
+                now = time.monotonic()
+                if now < self.paused_until:
+                    await asyncio.sleep(self.paused_until - now)
+                    continue
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def pause(self, seconds):
+        """Stop handing out tokens for the given number of seconds"""
+        if seconds > config.RATE_LIMIT_MAX_PAUSE:
+            if not self.blocked:
+                logger.warning(f"{self.host} asked to pause for {seconds:.0f}s "
+                               f"(limit {config.RATE_LIMIT_MAX_PAUSE}s); skipping the host for this run")
+            self.blocked = True
+            return
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+        # Start empty once the pause ends instead of refilling during it
+        self.tokens = 0
+        self.updated = self.paused_until
+
+    def update_from_headers(self, headers):
+        """Honor Retry-After and steer the rate toward the advertised X-RateLimit budget"""
+        retry_after = parse_retry_after(headers.get('Retry-After'))
+        if retry_after:
+            self.pause(retry_after)
+            return
+        rate_limit = parse_rate_limit(headers)
+        if rate_limit is None:
+            return
+        remaining, reset = rate_limit
+        if remaining == 0:
+            self.pause(reset)
+        elif reset > 0:
+            # Spread the remaining budget over the window, within the configured bounds
+            self.rate = min(config.RATE_LIMIT_MAX, max(config.RATE_LIMIT_MIN, remaining / reset))
+
+
+def parse_pool_context():
+    """Pick a start method that is safe in a multi-threaded parent (forkserver, else spawn)"""
+    method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+    return multiprocessing.get_context(method)
 
 
 class WeltScraper:
     """Scraper for welt.de news articles"""
 
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update(config.HEADERS)
-        self.articles = []
+        # Ensure data directory exists
+        os.makedirs(config.DATA_DIR, exist_ok=True)
+
+        self.client = None
+        self.semaphore = None
+        self.limiters = {}
+        self.scraped_at = None
+        self.parse_pool = None
+        # URLs claimed during this run, plus a Bloom filter of articles saved by any run
         self.scraped_urls = set()
+        self.seen = self.load_seen()
+        self.combined_file = None
+        self.http_cache = self.load_cache()
+        self.fresh_validators = {}
 
-    def get_page(self, url, retries=0):
-        """Fetch a page with error handling and retries"""
+    def load_cache(self):
+        """Load ETag/Last-Modified validators saved by a previous run"""
+        try:
+            with open(config.CACHE_FILE, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cache {config.CACHE_FILE}: {e}")
+            return {}
+
+    def save_cache(self):
+        """Persist validators so the next run can send conditional requests"""
+        try:
+            with open_atomic(config.CACHE_FILE) as f:
+                f.write(dump_json(self.http_cache))
+        except OSError as e:
+            logger.error(f"Error saving cache to {config.CACHE_FILE}: {e}")
+
+    def load_seen(self):
+        """Load the Bloom filter of article URLs saved by previous runs"""
         try:
-            logger.info(f"Fetching: {url}")
-            response = self.session.get(
-                url,
-                timeout=config.REQUEST_TIMEOUT,
-                allow_redirects=True
+            with open(config.SEEN_FILE, 'rb') as f:
+                return ScalableBloomFilter.fromfile(f)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable seen-URL filter {config.SEEN_FILE}: {e}")
+        return ScalableBloomFilter(
+            initial_capacity=config.SEEN_CAPACITY,
+            error_rate=config.SEEN_ERROR_RATE
+        )
+
+    def save_seen(self):
+        """Persist the seen-URL Bloom filter for the next run"""
+        try:
+            with open_atomic(config.SEEN_FILE) as f:
+                self.seen.tofile(f)
+        except OSError as e:
+            logger.error(f"Error saving seen-URL filter to {config.SEEN_FILE}: {e}")
+
+    def is_known(self, url):
+        """Check whether an article was claimed this run or saved by an earlier one"""
+        return url in self.scraped_urls or url in self.seen
+
+    def conditional_headers(self, url):
+        """Build If-None-Match/If-Modified-Since headers for a cached URL"""
+        cached = self.http_cache.get(url, {})
+        headers = {}
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+        return headers
+
+    def remember_page(self, url, **data):
+        """Cache the validators of a fully processed page along with extra data"""
+        validators = self.fresh_validators.pop(url, None)
+        if validators:
+            self.http_cache[url] = {**validators, **data}
+
+    def create_client(self):
+        """Create the shared HTTP client (must be called inside the event loop)"""
+        # HTTP/2 multiplexes concurrent article requests over one TLS connection
+        # to welt.de; the pool only matters for other hosts or HTTP/1.1 fallback
+        return httpx.AsyncClient(
+            http2=True,
+            headers=config.HEADERS,
+            timeout=config.REQUEST_TIMEOUT,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=config.CONNECTION_POOL_SIZE,
+                max_keepalive_connections=config.CONNECTION_POOL_SIZE,
+                keepalive_expiry=config.KEEPALIVE_TIMEOUT
             )
-            response.raise_for_status()
-            response.encoding = 'utf-8'
-            return response
-        except requests.RequestException as e:
-            logger.error(f"Error fetching {url}: {e}")
-            if retries < config.MAX_RETRIES:
-                logger.info(f"Retrying... (attempt {retries + 1}/{config.MAX_RETRIES})")
-                time.sleep(config.REQUEST_DELAY * 2)
-                return self.get_page(url, retries + 1)
-            return None
+        )
+
+    def limiter_for(self, url):
+        """Return the token bucket for the URL's host, creating it on first use"""
+        host = urlparse(url).netloc
+        if host not in self.limiters:
+            self.limiters[host] = TokenBucket(host, config.RATE_LIMIT, config.RATE_LIMIT_BURST)
+        return self.limiters[host]
 
-    def extract_article_links(self, soup, base_url):
-        """Extract article URLs from a page"""
+    async def get_page(self, url, retries=0, cache_validators=False):
+        """Fetch a page with error handling and retries"""
+        retry_after = None
+        limiter = self.limiter_for(url)
+        try:
+            async with self.semaphore:
+                await limiter.acquire()
+                if limiter.blocked:
+                    logger.warning(f"Skipping {url}: {limiter.host} is rate-limited for this run")
+                    return None
+                logger.info(f"Fetching: {url}")
+                async with self.client.stream('GET', url, headers=self.conditional_headers(url)) as response:
+                    limiter.update_from_headers(response.headers)
+                    if response.status_code == 304:
+                        logger.info(f"Not modified: {url}")
+                        return NOT_MODIFIED
+                    response.raise_for_status()
+
+                    # Leave PDFs, images etc. unread; exiting the context drops the body
+                    content_type = response.headers.get('Content-Type', '')
+                    if not content_type.lower().startswith(HTML_CONTENT_TYPES):
+                        logger.warning(f"Skipping non-HTML response ({content_type or 'no Content-Type'}): {url}")
+                        return None
+                    content_length = response.headers.get('Content-Length', '')
+                    if content_length.isdigit() and int(content_length) > config.MAX_PAGE_SIZE:
+                        logger.warning(f"Skipping oversized page ({content_length} bytes): {url}")
+                        return None
+
+                    # Raw (already decompressed) bytes go straight to the parser
+                    content = bytearray()
+                    async for chunk in response.aiter_bytes():
+                        content += chunk
+                        if len(content) > config.MAX_PAGE_SIZE:
+                            logger.warning(f"Skipping oversized page (over {config.MAX_PAGE_SIZE} bytes): {url}")
+                            return None
+
+                    etag = response.headers.get('ETag')
+                    last_modified = response.headers.get('Last-Modified')
+                    # Only kept for pages the caller will remember_page(), i.e. categories
+                    if cache_validators and (etag or last_modified):
+                        self.fresh_validators[url] = {'etag': etag, 'last_modified': last_modified}
+                    return bytes(content)
+        except httpx.HTTPStatusError as e:
+            status = e.response.status_code
+            logger.error(f"Error fetching {url}: HTTP {status}")
+            if not is_retryable_status(status):
+                return None
+            retry_after = parse_retry_after(e.response.headers.get('Retry-After'))
+        except httpx.HTTPError as e:
+            logger.error(f"Error fetching {url}: {e!r}")
+
+        if retries < config.MAX_RETRIES and not limiter.blocked:
+            delay = backoff_delay(retries, retry_after)
+            logger.info(f"Retrying in {delay:.1f}s... (attempt {retries + 1}/{config.MAX_RETRIES})")
+            await asyncio.sleep(delay)
+            return await self.get_page(url, retries + 1, cache_validators)
+        return None
+
+    def extract_article_links(self, tree, base_url):
+        """Extract all article URLs from a page (claimed/seen URLs are filtered by the caller)"""
         article_links = set()
 
         # Look for article links (welt.de typically uses /article/ or /a[0-9]+ patterns)
-        for link in soup.find_all('a', href=True):
-            href = link['href']
-
-            # Convert relative URLs to absolute
-            full_url = urljoin(base_url, href)
-
-            # Filter for article URLs (common patterns on welt.de)
-            if any(pattern in full_url for pattern in ['/article/', '/politik/', '/wirtschaft/',
-                                                        '/sport/', '/kultur/', '/wissenschaft/']):
-                # Check if it looks like an article (contains article ID pattern)
-                if full_url.startswith(config.BASE_URL) and full_url not in self.scraped_urls:
-                    # Avoid category pages, look for actual articles
-                    path = urlparse(full_url).path
-                    if len(path.split('/')) >= 3 and not full_url.endswith('/'):
-                        article_links.add(full_url)
+        for href in _XP_LINKS(tree):
+            # Convert relative URLs to absolute; #comments etc. point at the same article
+            full_url = urldefrag(urljoin(base_url, href)).url
+
+            if ARTICLE_URL_RE.match(full_url):
+                article_links.add(full_url)
 
         return article_links
 
-    def extract_article_content(self, url):
+    async def extract_article_content(self, url):
         """Extract article content from a single article page"""
-        response = self.get_page(url)
-        if not response:
+        content = await self.get_page(url)
+        if not content or content is NOT_MODIFIED:
             return None
 
-        soup = BeautifulSoup(response.text, 'lxml')
-
-        article_data = {
-            'url': url,
-            'scraped_at': datetime.now().isoformat(),
-            'title': None,
-            'text': None,
-            'date': None,
-            'author': None,
-            'category': None,
-        }
-
-        try:
-            # Extract title
-            title_tag = soup.find('h1') or soup.find('title')
-            if title_tag:
-                article_data['title'] = title_tag.get_text(strip=True)
-
-            # Extract author
-            author_tag = soup.find('meta', {'name': 'author'}) or \
-                        soup.find('span', class_=lambda x: x and 'author' in x.lower()) or \
-                        soup.find('a', {'rel': 'author'})
-            if author_tag:
-                article_data['author'] = author_tag.get('content') if author_tag.name == 'meta' else author_tag.get_text(strip=True)
-
-            # Extract publication date
-            date_tag = soup.find('meta', {'property': 'article:published_time'}) or \
-                      soup.find('meta', {'name': 'date'}) or \
-                      soup.find('time')
-            if date_tag:
-                date_str = date_tag.get('content') or date_tag.get('datetime') or date_tag.get_text(strip=True)
-                try:
-                    article_data['date'] = date_parser.parse(date_str).isoformat()
-                except:
-                    article_data['date'] = date_str
-
-            # Extract category
-            category_tag = soup.find('meta', {'property': 'article:section'}) or \
-                          soup.find('meta', {'name': 'category'})
-            if category_tag:
-                article_data['category'] = category_tag.get('content')
-            else:
-                # Try to extract from URL
-                path_parts = urlparse(url).path.split('/')
-                if len(path_parts) > 1:
-                    article_data['category'] = path_parts[1]
-
-            # Extract article text
-            # Look for article body (common patterns on news sites)
-            article_body = soup.find('article') or \
-                          soup.find('div', class_=lambda x: x and any(term in str(x).lower() for term in ['article', 'content', 'body', 'text']))
-
-            if article_body:
-                # Extract all paragraphs
-                paragraphs = article_body.find_all('p')
-                text_parts = [p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True)]
-                article_data['text'] = '\n\n'.join(text_parts)
-
-            # Validate we got essential data
-            if not article_data['title'] or not article_data['text']:
-                logger.warning(f"Missing essential data for {url}")
-                return None
-
-            logger.info(f"Successfully extracted: {article_data['title'][:50]}...")
-            return article_data
-
-        except Exception as e:
-            logger.error(f"Error extracting content from {url}: {e}")
-            return None
+        # Parsing is CPU-bound, so it runs in a worker process to keep the event loop free
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.parse_pool, parse_article, url, content, self.scraped_at)
 
     def generate_article_id(self, url):
         """Generate a unique ID for an article based on URL"""
-        return hashlib.md5(url.encode()).hexdigest()[:12]
+        return hashlib.blake2b(url.encode('utf-8'), digest_size=6).hexdigest()
 
     def save_article(self, article_data):
-        """Save article to individual JSON file"""
+        """Save article to individual JSON file and the combined JSON Lines output; return True on success"""
         if not article_data:
-            return
+            return False
 
         # Create filename
         article_id = self.generate_article_id(article_data['url'])
@@ -172,75 +703,132 @@ class WeltScraper:
         filename = config.ARTICLE_FILENAME_FORMAT.format(date=date_str, id=article_id)
         filepath = os.path.join(config.DATA_DIR, filename)
 
-        # Save to file
+        # Save to file, and append one line to the combined output
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(article_data, f, ensure_ascii=False, indent=2)
+            payload = dump_json(article_data)
+            with open_atomic(filepath) as f:
+                f.write(payload)
+            if self.combined_file:
+                self.combined_file.write(payload + b'\n')
             logger.info(f"Saved article to {filepath}")
-            self.articles.append(article_data)
+            self.seen.add(article_data['url'])
+            return True
         except Exception as e:
             logger.error(f"Error saving article to {filepath}: {e}")
+            return False
 
-    def save_all_articles(self):
-        """Save all articles to a combined JSON file"""
-        try:
-            with open(config.COMBINED_OUTPUT, 'w', encoding='utf-8') as f:
-                json.dump(self.articles, f, ensure_ascii=False, indent=2)
-            logger.info(f"Saved {len(self.articles)} articles to {config.COMBINED_OUTPUT}")
-        except Exception as e:
-            logger.error(f"Error saving combined articles: {e}")
-
-    def scrape_category(self, category_url, max_articles):
-        """Scrape articles from a category page"""
+    async def scrape_category(self, category_url, max_articles):
+        """Fetch a category page and claim up to max_articles new article URLs"""
         logger.info(f"Scraping category: {category_url}")
 
-        response = self.get_page(category_url)
-        if not response:
-            return
-
-        soup = BeautifulSoup(response.text, 'lxml')
-
-        # Extract article links
-        article_links = self.extract_article_links(soup, category_url)
-        logger.info(f"Found {len(article_links)} article links in {category_url}")
-
-        # Scrape each article
-        count = 0
-        for article_url in article_links:
-            if count >= max_articles:
-                break
-
-            if article_url in self.scraped_urls:
-                continue
-
-            self.scraped_urls.add(article_url)
-
-            # Extract and save article
-            article_data = self.extract_article_content(article_url)
-            if article_data:
-                self.save_article(article_data)
-                count += 1
-
-            # Respectful delay
-            time.sleep(config.REQUEST_DELAY)
-
-    def scrape_all(self):
+        content = await self.get_page(category_url, cache_validators=True)
+        if content is NOT_MODIFIED:
+            # Reuse the links extracted when the page last changed
+            article_links = set(self.http_cache[category_url].get('article_links', []))
+            logger.info(f"Reusing {len(article_links)} cached article links for {category_url}")
+        elif content:
+            try:
+                tree = parse_html(content)
+            except etree.ParserError as e:
+                logger.error(f"Error parsing {category_url}: {e}")
+                return []
+
+            # Extract article links; the cache keeps every match so a later 304 doesn't
+            # depend on which category happened to claim a shared article first
+            article_links = self.extract_article_links(tree, category_url)
+            logger.info(f"Found {len(article_links)} article links in {category_url}")
+            self.remember_page(category_url, article_links=sorted(article_links))
+        else:
+            return []
+
+        # Claim the URLs up front so no other category schedules them again
+        article_urls = [url for url in article_links if not self.is_known(url)][:max_articles]
+        self.scraped_urls.update(article_urls)
+        return article_urls
+
+    async def worker(self, url_queue, result_queue):
+        """Process queued category and article URLs until cancelled"""
+        while True:
+            kind, url, category_url = await url_queue.get()
+            try:
+                if kind == 'category':
+                    # Articles go back onto the same queue so they overlap with other categories
+                    for article_url in await self.scrape_category(url, config.MAX_ARTICLES_PER_CATEGORY):
+                        url_queue.put_nowait(('article', article_url, category_url))
+                else:
+                    article_data = await self.extract_article_content(url)
+                    if article_data:
+                        await result_queue.put((category_url, article_data))
+            except Exception as e:
+                logger.error(f"Error processing {url}: {e}")
+            finally:
+                url_queue.task_done()
+
+    async def write_articles(self, result_queue, counts):
+        """Save finished articles one at a time until a None sentinel arrives"""
+        # The combined output stays open for the whole run; save_article appends to it
+        saved = 0
+        with open(config.COMBINED_OUTPUT, 'ab', buffering=1 << 20) as self.combined_file:
+            while True:
+                item = await result_queue.get()
+                if item is None:
+                    break
+                category_url, article_data = item
+                if not self.save_article(article_data):
+                    continue
+                counts[category_url] += 1
+                saved += 1
+                if saved % config.SEEN_SAVE_INTERVAL == 0:
+                    # Flush the lines before the filter that claims they were written
+                    self.combined_file.flush()
+                    self.save_seen()
+        self.combined_file = None
+
+    async def scrape_all(self):
         """Main scraping function"""
         logger.info("Starting Welt.de scraper...")
 
-        # Ensure data directory exists
-        os.makedirs(config.DATA_DIR, exist_ok=True)
-
-        total_articles = 0
+        # One timestamp for the whole run instead of a clock read per article
+        self.scraped_at = datetime.now(timezone.utc).isoformat(timespec='seconds')
+        self.semaphore = asyncio.Semaphore(config.MAX_CONCURRENT_REQUESTS)
+        url_queue = asyncio.Queue()
+        result_queue = asyncio.Queue()
+        counts = {category_url: 0 for category_url in config.CATEGORY_URLS}
         for category_url in config.CATEGORY_URLS:
-            articles_before = len(self.articles)
-            self.scrape_category(category_url, config.MAX_ARTICLES_PER_CATEGORY)
-            articles_scraped = len(self.articles) - articles_before
-            total_articles += articles_scraped
-            logger.info(f"Scraped {articles_scraped} articles from {category_url}")
+            url_queue.put_nowait(('category', category_url, category_url))
 
-        # Save combined output
-        self.save_all_articles()
+        # Persist the cache and filter even if the run is interrupted, since every
+        # article saved so far is already in the output files
+        try:
+            # Article parsing runs in separate processes; network and file I/O stay on the loop.
+            # The pool starts after httpx has spun up resolver threads, so don't fork.
+            with ProcessPoolExecutor(max_workers=config.PARSE_WORKERS,
+                                     mp_context=parse_pool_context()) as self.parse_pool:
+                async with self.create_client() as self.client:
+                    # A single writer keeps all file output on one coroutine
+                    writer = asyncio.create_task(self.write_articles(result_queue, counts))
+                    workers = [
+                        asyncio.create_task(self.worker(url_queue, result_queue))
+                        for _ in range(config.NUM_WORKERS)
+                    ]
+
+                    await url_queue.join()
+                    for task in workers:
+                        task.cancel()
+                    await asyncio.gather(*workers, return_exceptions=True)
+
+                    await result_queue.put(None)
+                    await writer
+        finally:
+            if self.combined_file:
+                # Interrupted mid-write: the writer task is cancelled later, so flush its lines now
+                self.combined_file.flush()
+            self.save_cache()
+            self.save_seen()
+
+        for category_url, articles_scraped in counts.items():
+            logger.info(f"Scraped {articles_scraped} articles from {category_url}")
+        total_articles = sum(counts.values())
 
         logger.info(f"Scraping complete! Total articles: {total_articles}")
         return total_articles
@@ -249,7 +837,7 @@ class WeltScraper:
 def main():
     """Main entry point"""
     scraper = WeltScraper()
-    scraper.scrape_all()
+    asyncio.run(scraper.scrape_all())
 
 
 if __name__ == "__main__":